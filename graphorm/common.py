@@ -1,10 +1,13 @@
 import builtins
 import inspect
+import threading
 from abc import ABCMeta
 from collections.abc import Callable
+from contextlib import suppress
 from typing import (
     Any,
 )
+from weakref import WeakValueDictionary
 
 from .properties import (
     DefaultPropertiesValidator,
@@ -28,6 +31,84 @@ COMMON_INTERNAL_KEYS = frozenset(
     }
 )
 
+# Aliased subclasses keyed by (class, alias name); entries drop once unused
+_alias_cache: "WeakValueDictionary[tuple[type, str], type]" = WeakValueDictionary()
+# Reentrant so a subclass hook that aliases another class cannot deadlock
+_alias_lock = threading.RLock()
+
+
+def _get_alias(cls: type, name: str, build: Callable[[str], type]) -> type:
+    """
+    Return the aliased class cached for (cls, name), building it on a miss.
+
+    Hits stay lock-free. A miss re-checks the cache and builds the class
+    under the lock, so concurrent callers aliasing the same class and name
+    create (and run __init_subclass__ for) exactly one class.
+
+    :param cls: Node/Edge class being aliased
+    :param name: Alias name
+    :param build: Creates the aliased subclass for a name
+    :return: The cached aliased class
+    """
+    key = (cls, name)
+    aliased_cls = _alias_cache.get(key)
+    if aliased_cls is None:
+        with _alias_lock:
+            aliased_cls = _alias_cache.get(key)
+            if aliased_cls is None:
+                aliased_cls = _alias_cache[key] = build(name)
+    return aliased_cls
+
+
+def _resolve_entity(
+    entity: type,
+) -> tuple[str, str | None, str | None, tuple[type, ...]]:
+    """
+    Resolve query alias, MATCH patterns and alias map keys for a Node/Edge class.
+
+    The result is cached in the class's own __dict__ (never inherited by aliased
+    subclasses), so repeated queries skip the hasattr/__bases__ probing.
+
+    :param entity: Node/Edge class or aliased class
+    :return: (alias, "(alias:Label)" or None, "[alias:RELATION]" or None,
+        classes the alias is registered under in alias maps)
+    """
+    resolved = entity.__dict__.get("__graphorm_resolved__")
+    if resolved is not None:
+        return resolved
+
+    node_pattern = edge_pattern = None
+    if hasattr(entity, "_alias"):
+        alias = entity._alias
+        # Aliased class: label/relation come from the class it was created from
+        base_class = entity.__bases__[0]
+        label = getattr(base_class, "__label__", base_class.__name__)
+        relation = getattr(
+            base_class,
+            "__relation_name__",
+            getattr(base_class, "__relation__", base_class.__name__),
+        )
+        node_pattern = f"({alias}:{label})"
+        edge_pattern = f"[{alias}:{relation}]"
+        # Conditions on the original class resolve to the alias as well
+        alias_keys = (entity, base_class)
+    else:
+        alias = entity.__name__.lower()
+        alias_keys = ()
+        if hasattr(entity, "__labels__"):
+            label = getattr(entity, "__label__", entity.__name__)
+            node_pattern = f"({alias}:{label})"
+            alias_keys = (entity,)
+        if hasattr(entity, "__relation__"):
+            edge_pattern = f"[{alias}:{entity.__relation__}]"
+            alias_keys = (entity,)
+
+    resolved = (alias, node_pattern, edge_pattern, alias_keys)
+    # Built-in/extension types reject new attributes
+    with suppress(TypeError):
+        entity.__graphorm_resolved__ = resolved
+    return resolved
+
 
 class CommonMetaclass(ABCMeta):
     __sealed_methods__ = {}
@@ -5,12 +5,20 @@ This module provides Delete class and delete() function for building DELETE/DETA
 in an object-oriented way, similar to SQLAlchemy 2.0.
 """
 
+from collections.abc import Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
 )
 
-from .select import Statement
+from .select import (
+    _MATCH,
+    _OPTIONAL_MATCH,
+    _RETURN,
+    Statement,
+    _OptionalMatch,
+    _RawMatch,
+)
 from .variable_length import VariableLength
 
 if TYPE_CHECKING:
@@ -24,6 +32,8 @@ class Delete(Statement):
     Provides fluent interface for building MATCH, WHERE, DELETE/DETACH DELETE clauses.
     """
 
+    __slots__ = ("_entities", "_detach", "_return_clauses")
+
     def __init__(self, *entities: Any):
         """
         Initialize Delete statement.
@@ -31,22 +41,29 @@ class Delete(Statement):
         :param entities: Node classes, aliases, or edge classes to delete
         """
         super().__init__()
-        self._entities = list(entities)
+        self._entities: tuple[Any, ...] = entities
         self._detach: bool = False
-        self._return_clauses: list[Any] = []
+        self._return_clauses: Sequence[Any] = ()
 
     def detach(self) -> "Delete":
         """Use DETACH DELETE instead of DELETE."""
+        self._cypher = None
         self._detach = True
         return self
 
     def returns(self, *expressions: Any) -> "Delete":
         """Add RETURN clause (optional for DELETE)."""
-        self._return_clauses = list(expressions)
+        self._cypher = None
+        self._return_clauses = expressions
         return self
 
     def to_cypher(self) -> str:
-        """Generate DELETE Cypher query."""
+        """Generate DELETE Cypher query (cached until the next builder call)."""
+        if self._cypher is not None:
+            return self._cypher
+        if self._params:
+            self._params = {}
+
         parts: list[str] = []
 
         # Generate MATCH clauses
@@ -54,12 +71,12 @@ class Delete(Statement):
         optional_patterns: list[str] = []
 
         for match_item in self._match_clauses:
-            if isinstance(match_item, tuple) and match_item[0] == "OPTIONAL":
-                pattern = self._entity_to_match_pattern(match_item[1])
+            if type(match_item) is _OptionalMatch:
+                pattern = self._entity_to_match_pattern(match_item.entity)
                 if pattern:
                     optional_patterns.append(pattern)
-            elif isinstance(match_item, tuple) and match_item[0] == "RAW":
-                match_patterns.append(match_item[1])
+            elif type(match_item) is _RawMatch:
+                match_patterns.append(match_item.pattern)
             else:
                 pattern = self._entity_to_match_pattern(match_item)
                 if pattern:
@@ -67,23 +84,28 @@ class Delete(Statement):
 
         # Fallback: if no match() was called, try to generate from entities
         if not match_patterns and not optional_patterns and self._entities:
-            for entity in self._entities:
-                pattern = self._entity_to_match_pattern(entity)
-                if pattern and pattern not in match_patterns:
-                    match_patterns.append(pattern)
+            # dict.fromkeys dedups in insertion order without a list scan
+            match_patterns = list(
+                dict.fromkeys(
+                    pattern
+                    for pattern in map(self._entity_to_match_pattern, self._entities)
+                    if pattern
+                )
+            )
 
         if match_patterns:
-            parts.append("MATCH " + ", ".join(match_patterns))
+            parts += (_MATCH, ", ".join(match_patterns))
 
         if optional_patterns:
             for pattern in optional_patterns:
-                parts.append(f"OPTIONAL MATCH {pattern}")
+                parts += (_OPTIONAL_MATCH, pattern)
 
         # WITH clause (if present)
         with_clause = self._build_with_clause()
         if with_clause:
             parts.append(with_clause)
-            alias_map = self._alias_map.copy()
+            # WITH bindings were added to _alias_map in place; WHERE only reads it
+            alias_map = self._alias_map
         else:
             alias_map = self._build_alias_map_from_match_clauses(include_edges=False)
             if not alias_map:
@@ -96,68 +118,53 @@ class Delete(Statement):
         if where_clause:
             parts.append(where_clause)
 
-        # DELETE clause
-        delete_targets: list[str] = []
+        # DELETE clause; dict keys keep first-seen order with O(1) dedup
+        delete_targets: dict[str, None] = {}
 
         # Extract aliases from match patterns first (they take precedence)
         for match_item in self._match_clauses:
-            if isinstance(match_item, tuple) and match_item[0] in ("OPTIONAL", "RAW"):
+            if type(match_item) is _OptionalMatch or type(match_item) is _RawMatch:
                 continue
 
             if isinstance(match_item, tuple) and len(match_item) == 3:
                 # Relationship pattern: extract src, edge, dst
                 src, edge, dst = match_item
                 if isinstance(src, type):
-                    alias = self._get_alias_for_entity(src)
-                    if alias not in delete_targets:
-                        delete_targets.append(alias)
+                    delete_targets[self._get_alias_for_entity(src)] = None
                 elif hasattr(src, "_alias"):
-                    if src._alias not in delete_targets:
-                        delete_targets.append(src._alias)
+                    delete_targets[src._alias] = None
                 if not isinstance(edge, VariableLength):
                     if isinstance(edge, type):
-                        alias = self._get_alias_for_entity(edge)
-                        if alias not in delete_targets:
-                            delete_targets.append(alias)
+                        delete_targets[self._get_alias_for_entity(edge)] = None
                     elif hasattr(edge, "_alias"):
-                        if edge._alias not in delete_targets:
-                            delete_targets.append(edge._alias)
+                        delete_targets[edge._alias] = None
                 if isinstance(dst, type):
-                    alias = self._get_alias_for_entity(dst)
-                    if alias not in delete_targets:
-                        delete_targets.append(alias)
+                    delete_targets[self._get_alias_for_entity(dst)] = None
                 elif hasattr(dst, "_alias"):
-                    if dst._alias not in delete_targets:
-                        delete_targets.append(dst._alias)
+                    delete_targets[dst._alias] = None
             elif isinstance(match_item, type):
-                alias = self._get_alias_for_entity(match_item)
-                if alias not in delete_targets:
-                    delete_targets.append(alias)
+                delete_targets[self._get_alias_for_entity(match_item)] = None
             elif hasattr(match_item, "_alias"):
-                if match_item._alias not in delete_targets:
-                    delete_targets.append(match_item._alias)
+                delete_targets[match_item._alias] = None
 
         # If no match patterns, use entities
         if not delete_targets and self._entities:
             for entity in self._entities:
                 if isinstance(entity, type):
-                    alias = self._get_alias_for_entity(entity)
-                    if alias not in delete_targets:
-                        delete_targets.append(alias)
+                    delete_targets[self._get_alias_for_entity(entity)] = None
                 elif hasattr(entity, "_alias"):
-                    if entity._alias not in delete_targets:
-                        delete_targets.append(entity._alias)
+                    delete_targets[entity._alias] = None
                 else:
-                    alias_str = str(entity)
-                    if alias_str not in delete_targets:
-                        delete_targets.append(alias_str)
+                    delete_targets[str(entity)] = None
 
         if not delete_targets:
             # Last resort: use wildcard or default
-            delete_targets = ["n"]
+            delete_targets = {"n": None}
 
-        delete_keyword = "DETACH DELETE" if self._detach else "DELETE"
-        parts.append(f"{delete_keyword} {', '.join(delete_targets)}")
+        parts += (
+            "DETACH DELETE" if self._detach else "DELETE",
+            ", ".join(delete_targets),
+        )
 
         # RETURN clause (optional)
         if self._return_clauses:
@@ -183,9 +190,10 @@ class Delete(Statement):
                 else:
                     return_parts.append(str(expr))
 
-            parts.append("RETURN " + ", ".join(return_parts))
+            parts += (_RETURN, ", ".join(return_parts))
 
-        return " ".join(parts)
+        self._cypher = " ".join(parts)
+        return self._cypher
 
 
 def delete(*entities: Any) -> Delete:
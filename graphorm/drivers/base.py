@@ -8,7 +8,6 @@ if TYPE_CHECKING:
     from graphorm.common import Common
     from graphorm.graph import Graph
     from graphorm.query_result import QueryResult
-    from graphorm.types import CMD
 
 
 class Driver(ABC):
@@ -17,7 +16,7 @@ class Driver(ABC):
     @abstractmethod
     def query(
         self,
-        cmd: "CMD",
+        cmd: str,
         graph_name: str,
         /,
         q: str = "",
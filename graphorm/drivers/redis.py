@@ -42,7 +42,7 @@ class RedisDriver(Driver):
 
     def query(
         self,
-        cmd: CMD,
+        cmd: str,
         graph_name: str,
         /,
         q: str = "",
@@ -1,7 +1,11 @@
 import json
 from logging import getLogger
 
-from .common import Common
+from .common import (
+    Common,
+    _get_alias,
+    _resolve_entity,
+)
 from .node import Node
 from .registry import Registry
 from .utils import (
@@ -42,7 +46,9 @@ class Edge(Common):
             relation = cls.__name__
 
         setattr(cls, "__relation__", relation)
-        Registry.add_edge_relation(cls)
+        # Aliased subclasses must not replace the real class under its relation
+        if "_alias" not in cls.__dict__:
+            Registry.add_edge_relation(cls)
 
         # Create Property descriptors for all annotated properties
         from .property import Property
@@ -54,14 +60,28 @@ class Edge(Common):
                     # Create Property descriptor
                     setattr(cls, prop_name, Property(cls, prop_name))
 
+        # Resolve alias and MATCH pattern at class definition, not on first query
+        _resolve_entity(cls)
+
     @classmethod
     def _alias_classmethod(cls, name: str) -> type:
         """
         Create an aliased version of this Edge class for use in queries.
+        Repeated calls with the same name return the same class.
 
         :param name: Alias name for the edge in queries
         :return: Aliased Edge class with _alias attribute set
         """
+        return _get_alias(cls, name, cls._build_alias)
+
+    @classmethod
+    def _build_alias(cls, name: str) -> type:
+        """
+        Build the aliased subclass cached by _alias_classmethod.
+
+        :param name: Alias name for the edge in queries
+        :return: New aliased Edge class
+        """
 
         # Create a simple subclass with alias attribute
         # __init_subclass__ will be called automatically, creating Property descriptors
@@ -7,6 +7,10 @@ and combining expressions with AND/OR operators.
 
 from typing import Any, Dict
 
+# Shared "param_<i>" names by index, filled on demand so binds skip str
+# formatting; writes are idempotent, so concurrent fills are harmless
+_PARAM_NAMES: dict[int, str] = {}
+
 
 def add_query_param(value: Any, params: Dict[str, Any], dedupe: bool = False) -> str:
     """
@@ -20,8 +24,10 @@ def add_query_param(value: Any, params: Dict[str, Any], dedupe: bool = False) ->
         for existing_name, existing_value in params.items():
             if existing_value == value:
                 return existing_name
-    param_num = len(params)
-    param_name = f"param_{param_num}"
+    index = len(params)
+    param_name = _PARAM_NAMES.get(index)
+    if param_name is None:
+        param_name = _PARAM_NAMES[index] = "param_" + str(index)
     params[param_name] = value
     return param_name
 
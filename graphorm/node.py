@@ -4,7 +4,11 @@ import json
 from logging import getLogger
 from typing import Any
 
-from .common import Common
+from .common import (
+    Common,
+    _get_alias,
+    _resolve_entity,
+)
 from .exceptions import QueryExecutionError
 from .registry import Registry
 from .utils import (
@@ -51,7 +55,9 @@ class Node(Common):
             label = cls.__name__
 
         setattr(cls, "__labels__", {label})
-        Registry.add_node_label(cls)
+        # Aliased subclasses must not replace the real class under its label
+        if "_alias" not in cls.__dict__:
+            Registry.add_node_label(cls)
 
         # Create Property descriptors for all annotated properties
         from .property import Property
@@ -63,14 +69,28 @@ class Node(Common):
                     # Create Property descriptor
                     setattr(cls, prop_name, Property(cls, prop_name))
 
+        # Resolve alias and MATCH pattern at class definition, not on first query
+        _resolve_entity(cls)
+
     @classmethod
     def _alias_classmethod(cls, name: str) -> type:
         """
         Create an aliased version of this Node class for use in queries.
+        Repeated calls with the same name return the same class.
 
         :param name: Alias name for the node in queries
         :return: Aliased Node class with _alias attribute set
         """
+        return _get_alias(cls, name, cls._build_alias)
+
+    @classmethod
+    def _build_alias(cls, name: str) -> type:
+        """
+        Build the aliased subclass cached by _alias_classmethod.
+
+        :param name: Alias name for the node in queries
+        :return: New aliased Node class
+        """
 
         # Create a simple subclass with alias attribute
         # __init_subclass__ will be called automatically, creating Property descriptors
@@ -163,18 +183,9 @@ class Node(Common):
 
         :return:
         """
-        res = "("
-        res += ":".join([self.alias, *self.labels])
-        pk_map = format_pk_cypher_map(self)
-        if pk_map:
-            res += pk_map
-        res += ")"
-        if not res or not res.startswith("(") or not res.endswith(")"):
-            raise ValueError(
-                f"Cannot form valid node pattern for {self}. "
-                f"Labels: {self.labels}, PK: {get_pk_fields(self)}, Alias: {self.alias}"
-            )
-        return res
+        # The pattern is always parenthesised; format_pk_cypher_map may be ""
+        labels = ":".join([self.alias, *self.labels])
+        return "(" + labels + format_pk_cypher_map(self) + ")"
 
     def __str__(self) -> str:
         """
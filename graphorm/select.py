@@ -5,6 +5,10 @@ This module provides Select class and select() function for building Cypher quer
 in an object-oriented way, similar to SQLAlchemy 2.0.
 """
 
+from collections.abc import (
+    Callable,
+    Sequence,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -13,6 +17,8 @@ from typing import (
     Union,
 )
 
+from .common import _resolve_entity
+from .expression import add_query_param
 from .variable_length import VariableLength
 
 if TYPE_CHECKING:
@@ -26,57 +32,123 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="Node")
 E = TypeVar("E", bound="Edge")
 
+# Clause keywords; to_cypher joins all parts with a single space
+_MATCH = "MATCH"
+_OPTIONAL_MATCH = "OPTIONAL MATCH"
+_REMOVE = "REMOVE"
+_RETURN = "RETURN"
+_RETURN_DISTINCT = "RETURN DISTINCT"
+_ORDER_BY = "ORDER BY"
+_SKIP = "SKIP"
+_LIMIT = "LIMIT"
+
+
+class _OptionalMatch:
+    """Pattern added via optional_match()."""
+
+    __slots__ = ("entity",)
+
+    def __init__(self, entity: Any) -> None:
+        self.entity = entity
+
+
+class _RawMatch:
+    """Raw Cypher pattern string added via match()."""
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+
+
+# (bound to_cypher or None, original clause object)
+_BoundClause = tuple[Callable[..., str] | None, Any]
+
+
+def _bind_clause(clause: Any) -> _BoundClause:
+    """Pair a clause with its bound to_cypher serializer (None for raw clauses)."""
+    return getattr(clause, "to_cypher", None), clause
+
 
 class Statement:
     """Base class for all Cypher statements (Select, Delete, etc.)."""
 
+    __slots__ = (
+        "_match_clauses",
+        "_where_clauses",
+        "_where_after_with",
+        "_match_clauses_after_with",
+        "_where_after_match_after_with",
+        "_with_clauses",
+        "_params",
+        "_alias_map",
+        "_with_called",
+        "_cypher",
+    )
+
     def __init__(self):
         self._match_clauses: list[Any] = []
-        self._where_clauses: list[Any] = []
-        self._where_after_with: list[Any] = []  # WHERE conditions after WITH
+        # WHERE conditions are stored as (bound to_cypher or None, condition)
+        self._where_clauses: list[_BoundClause] = []
+        self._where_after_with: list[_BoundClause] = []  # WHERE after WITH
         self._match_clauses_after_with: list[Any] = []  # MATCH patterns after WITH
-        self._where_after_match_after_with: list[Any] = []  # WHERE after that MATCH
-        self._with_clauses: list[Any] = []
+        # WHERE after that MATCH
+        self._where_after_match_after_with: list[_BoundClause] = []
+        # WITH expressions are stored as (formatter, expression)
+        self._with_clauses: list[tuple[Callable[..., str], Any]] = []
         self._params: dict[str, Any] = {}
-        self._param_counter: int = 0
         self._alias_map: dict[Any, str] = {}
         self._with_called: bool = False  # Track if with_() has been called
+        self._cypher: str | None = None  # Compiled query, reset by every mutator
 
     def match(self, *patterns: Any) -> "Statement":
         """Add MATCH clause."""
+        self._cypher = None
         target = (
             self._match_clauses_after_with
             if self._with_called
             else self._match_clauses
         )
-        for pattern in patterns:
-            if isinstance(pattern, str):
-                # Raw Cypher pattern (supports variable-length: *1..3, *)
-                target.append(("RAW", pattern))
-            else:
-                target.append(pattern)
+        # Raw Cypher string patterns (support variable-length: *1..3, *) are wrapped
+        target += [
+            _RawMatch(pattern) if isinstance(pattern, str) else pattern
+            for pattern in patterns
+        ]
         return self
 
     def optional_match(self, *entities: Any) -> "Statement":
         """Add OPTIONAL MATCH clause."""
-        for entity in entities:
-            self._match_clauses.append(("OPTIONAL", entity))
+        self._cypher = None
+        self._match_clauses += [_OptionalMatch(entity) for entity in entities]
         return self
 
     def where(self, *conditions: Any) -> "Statement":
         """Add WHERE clause."""
+        self._cypher = None
         # If with_() has been called and match-after-with exists, add to WHERE after that MATCH
         if self._with_called and len(self._match_clauses_after_with) > 0:
-            self._where_after_match_after_with.extend(conditions)
+            target = self._where_after_match_after_with
         elif self._with_called:
-            self._where_after_with.extend(conditions)
+            target = self._where_after_with
+        else:
+            target = self._where_clauses
+        # Bind each serializer once here instead of probing it on every render
+        if len(conditions) == 1:
+            target.append(_bind_clause(conditions[0]))
         else:
-            self._where_clauses.extend(conditions)
+            target.extend(map(_bind_clause, conditions))
         return self
 
     def with_(self, *expressions: Any) -> "Statement":
         """Add WITH clause."""
-        self._with_clauses.extend(expressions)
+        self._cypher = None
+        if len(expressions) == 1:
+            expr = expressions[0]
+            self._with_clauses.append((_classify_with_expression(expr), expr))
+        else:
+            self._with_clauses.extend(
+                (_classify_with_expression(expr), expr) for expr in expressions
+            )
         self._with_called = True  # Mark that WITH has been called
         return self
 
@@ -86,10 +158,8 @@ class Statement:
 
     def _add_param(self, value: Any) -> str:
         """Add parameter and return parameter name."""
-        param_name = f"param_{self._param_counter}"
-        self._param_counter += 1
-        self._params[param_name] = value
-        return param_name
+        # Same naming scheme as expressions use, so names never collide
+        return add_query_param(value, self._params)
 
     def _build_where_clause(
         self, alias_map: dict[Any, str] = None, where_clauses: list[Any] = None
@@ -102,18 +172,13 @@ class Statement:
             return ""
 
         if alias_map is None:
-            alias_map = self._alias_map.copy()
-        if not alias_map:
-            alias_map = self._build_alias_map_from_match_clauses(include_edges=False)
-
-        where_parts: list[str] = []
-        for condition in where_clauses:
-            if hasattr(condition, "to_cypher"):
-                where_parts.append(condition.to_cypher(self._params, alias_map))
-            else:
-                where_parts.append(str(condition))
+            alias_map = self._alias_map
 
-        return "WHERE " + " AND ".join(where_parts)
+        params = self._params
+        return "WHERE " + " AND ".join(
+            to_cypher(params, alias_map) if to_cypher is not None else str(condition)
+            for to_cypher, condition in where_clauses
+        )
 
     def _build_with_clause(self, alias_map: dict[Any, str] = None) -> str:
         """Build WITH clause string."""
@@ -121,54 +186,18 @@ class Statement:
             return ""
 
         if alias_map is None:
-            alias_map = self._alias_map.copy()
+            alias_map = self._alias_map
 
         with_parts: list[str] = []
         alias_map_for_with: dict[Any, str] = {}
 
-        for expr in self._with_clauses:
-            if isinstance(expr, tuple) and len(expr) == 2:
-                # (expression, alias) tuple
-                expr_obj, alias_name = expr
-                expr_str = self._format_expression(expr_obj, alias_map)
-                with_parts.append(f"{expr_str} AS {alias_name}")
-                # Update alias map
-                if hasattr(expr_obj, "node_class"):
-                    alias_map_for_with[expr_obj.node_class] = alias_name
-            elif hasattr(expr, "to_cypher"):
-                # Expression with label
-                # Check if it's a Function (doesn't accept params)
-                if hasattr(expr, "name"):  # Function
-                    expr_str = expr.to_cypher(alias_map=alias_map)
-                    # Function.to_cypher() already includes "AS label" if it has _label
-                    # So we don't need to add it again
-                    with_parts.append(expr_str)
-                else:
-                    expr_str = expr.to_cypher(params=self._params, alias_map=alias_map)
-                    if hasattr(expr, "_label") and expr._label:
-                        # Check if AS is already in expr_str (from to_cypher)
-                        if " AS " not in expr_str:
-                            with_parts.append(f"{expr_str} AS {expr._label}")
-                        else:
-                            with_parts.append(expr_str)
-                        # Update alias map if it's a property
-                        if hasattr(expr, "node_class"):
-                            alias_map_for_with[expr.node_class] = expr._label
-                    else:
-                        with_parts.append(expr_str)
-            elif isinstance(expr, type):
-                # Node/Edge class - use its alias
-                if hasattr(expr, "_alias"):
-                    with_parts.append(expr._alias)
-                else:
-                    alias = self._get_alias_for_entity(expr)
-                    with_parts.append(alias)
-            else:
-                with_parts.append(str(expr))
+        for formatter, expr in self._with_clauses:
+            with_parts.append(formatter(self, expr, alias_map, alias_map_for_with))
 
-        # Update alias_map for subsequent clauses
+        # Update alias_map for subsequent clauses (in place, no copy)
         alias_map.update(alias_map_for_with)
-        self._alias_map.update(alias_map_for_with)
+        if alias_map is not self._alias_map:
+            self._alias_map.update(alias_map_for_with)
 
         return "WITH " + ", ".join(with_parts)
 
@@ -183,19 +212,14 @@ class Statement:
             else:
                 return expr.to_cypher(params=self._params, alias_map=alias_map)
         elif isinstance(expr, type):
-            if hasattr(expr, "_alias"):
-                return expr._alias
-            else:
-                return self._get_alias_for_entity(expr)
+            return self._get_alias_for_entity(expr)
         else:
             return str(expr)
 
     def _get_alias_for_entity(self, entity: Any) -> str:
         """Get default alias for entity."""
         if isinstance(entity, type):
-            if hasattr(entity, "_alias"):
-                return entity._alias
-            return entity.__name__.lower()
+            return _resolve_entity(entity)[0]
         elif hasattr(entity, "_alias"):
             return entity._alias
         else:
@@ -204,14 +228,9 @@ class Statement:
     def _add_to_alias_map(self, entity: Any, alias_map: dict[Any, str]) -> None:
         """Add entity to alias map if it's a Node/Edge class."""
         if isinstance(entity, type):
-            if hasattr(entity, "_alias"):
-                alias = entity._alias
-                alias_map[entity] = alias
-                if hasattr(entity, "__bases__") and len(entity.__bases__) > 0:
-                    base_class = entity.__bases__[0]
-                    alias_map[base_class] = alias
-            elif hasattr(entity, "__labels__") or hasattr(entity, "__relation__"):
-                alias_map[entity] = self._get_alias_for_entity(entity)
+            alias, _, _, alias_keys = _resolve_entity(entity)
+            for key in alias_keys:
+                alias_map[key] = alias
 
     def _build_alias_map_from_match_clauses(
         self,
@@ -225,9 +244,9 @@ class Statement:
         )
         alias_map: dict[Any, str] = {}
         for match_item in clauses:
-            if isinstance(match_item, tuple) and match_item[0] == "OPTIONAL":
-                match_item = match_item[1]
-            elif isinstance(match_item, tuple) and match_item[0] == "RAW":
+            if type(match_item) is _OptionalMatch:
+                match_item = match_item.entity
+            elif type(match_item) is _RawMatch:
                 continue
             if isinstance(match_item, tuple) and len(match_item) == 3:
                 src, edge, dst = match_item
@@ -239,24 +258,53 @@ class Statement:
                 self._add_to_alias_map(match_item, alias_map)
         return alias_map
 
-    def _get_label_from_class(self, node_class: type) -> str:
-        """Get label from Node class."""
-        if hasattr(node_class, "__label__"):
-            return node_class.__label__
-        else:
-            return node_class.__name__
+    def _build_alias_maps_from_match_items(
+        self, match_items: list[Any]
+    ) -> tuple[dict[Any, str], dict[Any, str]]:
+        """
+        Build node-only and edge-inclusive alias maps in a single pass.
+
+        Equivalent to calling _build_alias_map_from_match_clauses() with
+        include_edges=False and include_edges=True, but walks the match items once.
+
+        :param match_items: Match clauses with OPTIONAL unwrapped and RAW dropped
+        :return: (node alias map, node and edge alias map)
+        """
+        alias_map: dict[Any, str] = {}
+        edge_alias_map: dict[Any, str] = {}
+        for match_item in match_items:
+            if isinstance(match_item, tuple) and len(match_item) == 3:
+                src, edge, dst = match_item
+                self._add_to_alias_map(src, alias_map)
+                self._add_to_alias_map(dst, alias_map)
+                if not isinstance(edge, VariableLength):
+                    self._add_to_alias_map(edge, edge_alias_map)
+            else:
+                self._add_to_alias_map(match_item, alias_map)
+        # Node and Edge classes never share keys, so merging is order-safe
+        return alias_map, {**alias_map, **edge_alias_map}
 
     def _get_relation_from_class(self, edge_class: type) -> str:
         """Get relation name from Edge class."""
-        if hasattr(edge_class, "__relation_name__"):
-            return edge_class.__relation_name__
-        elif hasattr(edge_class, "__relation__"):
-            return edge_class.__relation__
-        else:
-            return edge_class.__name__
+        # Edge.__init_subclass__ already resolved __relation_name__ into __relation__
+        return getattr(edge_class, "__relation__", edge_class.__name__)
 
     def _entity_to_match_pattern(self, entity: Any) -> str:
-        """Convert entity to MATCH pattern."""
+        """
+        Convert entity (Node class, alias, tuple pattern, etc.) to MATCH pattern.
+
+        Supports:
+        - Node class: Page.alias("a") → (a:Page)
+        - Tuple pattern: (Page.alias("a"), Linked.alias("r"), Page.alias("b")) → (a:Page)-[r:Linked]->(b:Page)
+        - String pattern: "(a:Page)-[r:Linked]->(b:Page)" → as-is
+
+        :param entity: Node class, alias, tuple pattern, or string
+        :return: MATCH pattern string or None
+        """
+        # String pattern (raw Cypher) - exact type check skips the MRO walk
+        if type(entity) is str:
+            return entity
+
         # Handle tuple patterns (relationship patterns)
         if isinstance(entity, tuple) and len(entity) == 3:
             src, edge, dst = entity
@@ -271,18 +319,7 @@ class Statement:
 
         # Handle Node classes and aliases
         if isinstance(entity, type):
-            if hasattr(entity, "_alias"):
-                alias = entity._alias
-                if hasattr(entity, "__bases__") and len(entity.__bases__) > 0:
-                    base_class = entity.__bases__[0]
-                    label = self._get_label_from_class(base_class)
-                else:
-                    label = entity.__name__
-                return f"({alias}:{label})"
-            elif hasattr(entity, "__labels__"):
-                alias = self._get_alias_for_entity(entity)
-                label = self._get_label_from_class(entity)
-                return f"({alias}:{label})"
+            return _resolve_entity(entity)[1]
         elif isinstance(entity, str):
             return entity
 
@@ -291,40 +328,127 @@ class Statement:
     def _variable_length_edge_to_pattern(self, v: VariableLength) -> str:
         """Convert VariableLength descriptor to Cypher edge pattern [:REL*...]."""
         relation = self._get_relation_from_class(v.edge_class)
-        min_h, max_h = v.min_hops, v.max_hops
-        if min_h is None and max_h is None:
-            suffix = "*"
-        elif min_h is not None and max_h is not None and min_h == max_h:
-            suffix = f"*{min_h}"
-        elif min_h is not None and max_h is not None:
-            suffix = f"*{min_h}..{max_h}"
-        elif min_h is not None:
-            suffix = f"*{min_h}.."
-        else:
-            suffix = "*"
-        return f"[:{relation}{suffix}]"
+        return f"[:{relation}{v.suffix}]"
 
     def _edge_to_match_pattern(self, edge: Any) -> str:
         """Convert edge to MATCH pattern."""
-        if isinstance(edge, VariableLength):
-            return self._variable_length_edge_to_pattern(edge)
         if isinstance(edge, type):
-            if hasattr(edge, "_alias"):
-                alias = edge._alias
-                if hasattr(edge, "__bases__") and len(edge.__bases__) > 0:
-                    base_class = edge.__bases__[0]
-                    relation = self._get_relation_from_class(base_class)
-                else:
-                    relation = edge.__name__
-                return f"[{alias}:{relation}]"
-            elif hasattr(edge, "__relation__"):
-                alias = self._get_alias_for_entity(edge)
-                relation = edge.__relation__
-                return f"[{alias}:{relation}]"
+            return _resolve_entity(edge)[2]
+        elif isinstance(edge, VariableLength):
+            return self._variable_length_edge_to_pattern(edge)
 
         return None
 
 
+def _format_with_as(
+    stmt: "Statement", expr: Any, alias_map: dict[Any, str], with_aliases: dict
+) -> str:
+    """(expression, alias) tuple - property aliases carry over past WITH."""
+    expr_obj, alias_name = expr
+    expr_str = stmt._format_expression(expr_obj, alias_map)
+    if hasattr(expr_obj, "node_class"):
+        with_aliases[expr_obj.node_class] = alias_name
+    return f"{expr_str} AS {alias_name}"
+
+
+def _format_with_function(
+    stmt: "Statement", expr: Any, alias_map: dict[Any, str], with_aliases: dict
+) -> str:
+    """Function - its to_cypher() already includes "AS label" when labelled."""
+    return expr.to_cypher(alias_map=alias_map)
+
+
+def _format_with_expression(
+    stmt: "Statement", expr: Any, alias_map: dict[Any, str], with_aliases: dict
+) -> str:
+    """Other expressions need params; a labelled property is renamed by WITH."""
+    expr_str = expr.to_cypher(params=stmt._params, alias_map=alias_map)
+    label = getattr(expr, "_label", None)
+    if not label:
+        return expr_str
+    if hasattr(expr, "node_class"):
+        with_aliases[expr.node_class] = label
+    # to_cypher() may already have added the AS part
+    if " AS " in expr_str:
+        return expr_str
+    return f"{expr_str} AS {label}"
+
+
+def _format_with_entity(
+    stmt: "Statement", expr: Any, alias_map: dict[Any, str], with_aliases: dict
+) -> str:
+    """Node/Edge class - use its alias."""
+    return stmt._get_alias_for_entity(expr)
+
+
+def _format_with_str(
+    stmt: "Statement", expr: Any, alias_map: dict[Any, str], with_aliases: dict
+) -> str:
+    return str(expr)
+
+
+def _classify_with_expression(expr: Any) -> Callable[..., str]:
+    """Pick the WITH formatter for an expression when it is added."""
+    if isinstance(expr, tuple) and len(expr) == 2:
+        return _format_with_as
+    if hasattr(expr, "to_cypher"):
+        if hasattr(expr, "name"):  # Function
+            return _format_with_function
+        return _format_with_expression
+    if isinstance(expr, type):
+        return _format_with_entity
+    return _format_with_str
+
+
+def _format_return_raw(stmt: "Select", expr: Any, alias_map: dict[Any, str]) -> str:
+    """String expression (e.g., "*" or raw Cypher) is emitted as-is."""
+    return expr
+
+
+def _format_return_labelled(
+    stmt: "Select", expr: Any, alias_map: dict[Any, str]
+) -> str:
+    """Function/ArithmeticExpression: after WITH a labelled result is used by label."""
+    label = getattr(expr, "_label", None)
+    if label and stmt._with_called:
+        return label
+    return expr.to_cypher(alias_map=alias_map)
+
+
+def _format_return_with_params(
+    stmt: "Select", expr: Any, alias_map: dict[Any, str]
+) -> str:
+    """CaseExpression and other expressions that need params."""
+    return expr.to_cypher(params=stmt._params, alias_map=alias_map)
+
+
+def _format_return_entity(stmt: "Select", expr: Any, alias_map: dict[Any, str]) -> str:
+    """Node class, aliased class or aliased instance - use its alias."""
+    return stmt._get_alias_for_entity(expr)
+
+
+def _format_return_str(stmt: "Select", expr: Any, alias_map: dict[Any, str]) -> str:
+    return str(expr)
+
+
+def _classify_return_expression(expr: Any) -> Callable[..., str]:
+    """Pick the RETURN formatter for the kind of expression."""
+    if isinstance(expr, str):
+        return _format_return_raw
+    if hasattr(expr, "to_cypher"):
+        # Function has "name", ArithmeticExpression has "left"
+        if hasattr(expr, "name") or hasattr(expr, "left"):
+            return _format_return_labelled
+        return _format_return_with_params
+    if isinstance(expr, type) or hasattr(expr, "_alias"):
+        return _format_return_entity
+    return _format_return_str
+
+
+# RETURN formatter per exact expression type, filled lazily by to_cypher
+_RETURN_FORMATTERS: dict[type, Callable[..., str]] = {}
+
+
 class Select(Statement, Generic[T]):
     """
     Select statement builder for Cypher queries.
@@ -332,6 +456,19 @@ class Select(Statement, Generic[T]):
     Provides fluent interface for building MATCH, WHERE, RETURN, ORDER BY, LIMIT, SKIP clauses.
     """
 
+    __slots__ = (
+        "_entities",
+        "_return_clauses",
+        "_order_by_clauses",
+        "_limit_value",
+        "_skip_value",
+        "_limit_fragment",
+        "_skip_fragment",
+        "_remove_clauses",
+        "_return_keyword",
+        "_returns_explicitly_set",
+    )
+
     def __init__(self, *entities: Any):
         """
         Initialize Select statement.
@@ -339,15 +476,17 @@ class Select(Statement, Generic[T]):
         :param entities: Node classes or aliases (deprecated - use match() instead)
         """
         super().__init__()
-        self._entities = list(
-            entities
-        )  # Kept for backward compatibility, but match() is now required
-        self._return_clauses: list[Any] = []
-        self._order_by_clauses: list[Any] = []
+        # Kept for backward compatibility, but match() is now required
+        self._entities: tuple[Any, ...] = entities
+        self._return_clauses: Sequence[Any] = ()
+        self._order_by_clauses: list[_BoundClause] = []
         self._limit_value: int = None
         self._skip_value: int = None
+        # SKIP/LIMIT rendered once when set, not on every to_cypher()
+        self._limit_fragment: str | None = None
+        self._skip_fragment: str | None = None
         self._remove_clauses: list[Any] = []
-        self._distinct: bool = False
+        self._return_keyword: str = _RETURN
         self._returns_explicitly_set: bool = False
 
     def match(self, *patterns: Any) -> "Select":
@@ -402,7 +541,11 @@ class Select(Statement, Generic[T]):
         :param expressions: Property expressions to remove (e.g., Page.error.remove())
         :return: Self for chaining
         """
-        self._remove_clauses.extend(expressions)
+        self._cypher = None
+        if len(expressions) == 1:
+            self._remove_clauses.append(expressions[0])
+        else:
+            self._remove_clauses.extend(expressions)
         return self
 
     def returns(self, *expressions: Any) -> "Select":
@@ -413,9 +556,10 @@ class Select(Statement, Generic[T]):
         :param expressions: Expressions to return (Node classes, aliases, properties, functions)
         :return: Self for chaining
         """
+        self._cypher = None
         self._returns_explicitly_set = True
         if expressions:
-            self._return_clauses = list(expressions)
+            self._return_clauses = expressions
         elif not self._return_clauses:
             # If no expressions and no return clauses set, use entities
             self._return_clauses = self._entities
@@ -428,8 +572,9 @@ class Select(Statement, Generic[T]):
         :param expressions: Expressions to return
         :return: Self for chaining
         """
-        self._distinct = True
-        self._return_clauses = list(expressions) if expressions else self._entities
+        self._cypher = None
+        self._return_keyword = _RETURN_DISTINCT
+        self._return_clauses = expressions or self._entities
         return self
 
     def orderby(self, *expressions: Union["OrderByExpression", Any]) -> "Select":
@@ -440,7 +585,11 @@ class Select(Statement, Generic[T]):
         :param expressions: Expressions to order by (properties with .asc() or .desc())
         :return: Self for chaining
         """
-        self._order_by_clauses.extend(expressions)
+        self._cypher = None
+        if len(expressions) == 1:
+            self._order_by_clauses.append(_bind_clause(expressions[0]))
+        else:
+            self._order_by_clauses.extend(map(_bind_clause, expressions))
         return self
 
     def limit(self, count: int) -> "Select":
@@ -450,7 +599,9 @@ class Select(Statement, Generic[T]):
         :param count: Maximum number of results
         :return: Self for chaining
         """
+        self._cypher = None
         self._limit_value = count
+        self._limit_fragment = None if count is None else f"{_LIMIT} {count}"
         return self
 
     def skip(self, count: int) -> "Select":
@@ -460,70 +611,139 @@ class Select(Statement, Generic[T]):
         :param count: Number of results to skip
         :return: Self for chaining
         """
+        self._cypher = None
         self._skip_value = count
+        self._skip_fragment = None if count is None else f"{_SKIP} {count}"
         return self
 
     def to_cypher(self) -> str:
         """
         Generate Cypher query string from this Select statement.
 
+        The result is cached on the statement until the next builder call, so
+        executing the same statement repeatedly renders it (and binds its
+        parameters) only once.
+
         :return: Cypher query string
         """
+        if self._cypher is not None:
+            return self._cypher
+        # Re-rendering after a builder call binds parameters from scratch; the
+        # dict allocated in __init__ is reused until something was bound
+        if self._params:
+            self._params = {}
+
+        # Bind state read repeatedly below to locals once
+        entities = self._entities
+        with_called = self._with_called
+        match_clauses_after_with = self._match_clauses_after_with
+        where_clauses = self._where_clauses
+        remove_clauses = self._remove_clauses
+        order_by_clauses = self._order_by_clauses
+        return_clauses = self._return_clauses
+        entity_to_match_pattern = self._entity_to_match_pattern
+
+        # Fast path for a lone Node class and no other clauses:
+        # MATCH (alias:Label) RETURN alias straight from the resolved class
+        match_clauses = self._match_clauses
+        if len(match_clauses) + len(entities) == 1 and not (
+            with_called
+            or where_clauses
+            or remove_clauses
+            or order_by_clauses
+            or return_clauses
+            or self._skip_fragment
+            or self._limit_fragment
+        ):
+            entity = (match_clauses or entities)[0]
+            if isinstance(entity, type):
+                alias, node_pattern = _resolve_entity(entity)[:2]
+                if node_pattern is not None:
+                    self._cypher = (
+                        f"{_MATCH} {node_pattern} {self._return_keyword} {alias}"
+                    )
+                    return self._cypher
+
         parts: list[str] = []
 
         # Generate MATCH clauses - match() is now required
         match_patterns: list[str] = []
         optional_patterns: list[str] = []
 
+        # Match clauses with OPTIONAL unwrapped and RAW dropped, shared by the
+        # alias maps and auto-RETURN below so the tags are only checked here
+        match_items: list[Any] = []
+
         # Process match clauses
-        for match_item in self._match_clauses:
-            if isinstance(match_item, tuple) and match_item[0] == "OPTIONAL":
+        for match_item in match_clauses:
+            if type(match_item) is _OptionalMatch:
                 # OPTIONAL MATCH
-                pattern = self._entity_to_match_pattern(match_item[1])
+                match_item = match_item.entity
+                match_items.append(match_item)
+                pattern = entity_to_match_pattern(match_item)
                 if pattern:
                     optional_patterns.append(pattern)
-            elif isinstance(match_item, tuple) and match_item[0] == "RAW":
+            elif type(match_item) is _RawMatch:
                 # Raw string pattern (supports variable-length paths)
-                match_patterns.append(match_item[1])
+                match_patterns.append(match_item.pattern)
             else:
-                pattern = self._entity_to_match_pattern(match_item)
+                match_items.append(match_item)
+                pattern = entity_to_match_pattern(match_item)
                 if pattern:
                     match_patterns.append(pattern)
 
         # Fallback: if no match() was called, try to generate from entities (backward compatibility)
-        if not match_patterns and not optional_patterns and self._entities:
-            for entity in self._entities:
-                pattern = self._entity_to_match_pattern(entity)
-                if pattern and pattern not in match_patterns:
-                    match_patterns.append(pattern)
+        if not match_patterns and not optional_patterns and entities:
+            # dict.fromkeys dedups in insertion order without a list scan
+            match_patterns = list(
+                dict.fromkeys(
+                    pattern
+                    for pattern in map(entity_to_match_pattern, entities)
+                    if pattern
+                )
+            )
 
         if match_patterns:
             # Combine all MATCH clauses
-            parts.append("MATCH " + ", ".join(match_patterns))
+            parts += (_MATCH, ", ".join(match_patterns))
 
         if optional_patterns:
             # Add OPTIONAL MATCH clauses
             for pattern in optional_patterns:
-                parts.append(f"OPTIONAL MATCH {pattern}")
-
-        # Build initial alias map from match patterns
-        alias_map = self._build_alias_map_from_match_clauses(include_edges=False)
-        if not alias_map:
-            for entity in self._entities:
-                self._add_to_alias_map(entity, alias_map)
-        self._alias_map.update(alias_map)
+                parts += (_OPTIONAL_MATCH, pattern)
+
+        # Build alias maps from match patterns once: nodes only for WHERE/WITH,
+        # nodes and edges for RETURN/ORDER BY. Plain MATCH ... RETURN entity
+        # queries never look classes up in them, so skip the walk there.
+        if (
+            with_called
+            or where_clauses
+            or remove_clauses
+            or order_by_clauses
+            or any(hasattr(expr, "to_cypher") for expr in (return_clauses or entities))
+        ):
+            alias_map, full_alias_map = self._build_alias_maps_from_match_items(
+                match_items
+            )
+            if not alias_map:
+                for entity in entities:
+                    self._add_to_alias_map(entity, alias_map)
+            if not full_alias_map:
+                full_alias_map = dict(alias_map)
+            self._alias_map.update(alias_map)
+        else:
+            alias_map, full_alias_map = {}, {}
 
         # WHERE clause before WITH (if any)
-        where_before_with = self._build_where_clause(alias_map, self._where_clauses)
+        where_before_with = self._build_where_clause(alias_map, where_clauses)
         if where_before_with:
             parts.append(where_before_with)
 
         # WITH clause (must come after MATCH and WHERE before WITH)
         with_clause = self._build_with_clause(alias_map)
         if with_clause:
+            # _build_with_clause already added the WITH bindings to alias_map
             parts.append(with_clause)
-            # Use updated alias_map from _build_with_clause
-            alias_map = self._alias_map.copy()
 
         # WHERE clause after WITH (if any)
         where_after_with = self._build_where_clause(alias_map, self._where_after_with)
@@ -531,27 +751,27 @@ class Select(Statement, Generic[T]):
             parts.append(where_after_with)
 
         # MATCH and WHERE after WITH (patterns added via match() after with_())
-        if self._match_clauses_after_with:
+        if match_clauses_after_with:
             match_patterns_after: list[str] = []
             optional_patterns_after: list[str] = []
-            for match_item in self._match_clauses_after_with:
-                if isinstance(match_item, tuple) and match_item[0] == "OPTIONAL":
-                    pattern = self._entity_to_match_pattern(match_item[1])
+            for match_item in match_clauses_after_with:
+                if type(match_item) is _OptionalMatch:
+                    pattern = entity_to_match_pattern(match_item.entity)
                     if pattern:
                         optional_patterns_after.append(pattern)
-                elif isinstance(match_item, tuple) and match_item[0] == "RAW":
-                    match_patterns_after.append(match_item[1])
+                elif type(match_item) is _RawMatch:
+                    match_patterns_after.append(match_item.pattern)
                 else:
-                    pattern = self._entity_to_match_pattern(match_item)
+                    pattern = entity_to_match_pattern(match_item)
                     if pattern:
                         match_patterns_after.append(pattern)
             if match_patterns_after:
-                parts.append("MATCH " + ", ".join(match_patterns_after))
+                parts += (_MATCH, ", ".join(match_patterns_after))
             for p in optional_patterns_after:
-                parts.append("OPTIONAL MATCH " + p)
+                parts += (_OPTIONAL_MATCH, p)
             alias_map_from_after = self._build_alias_map_from_match_clauses(
                 include_edges=False,
-                match_clauses=self._match_clauses_after_with,
+                match_clauses=match_clauses_after_with,
             )
             alias_map.update(alias_map_from_after)
             self._alias_map.update(alias_map_from_after)
@@ -563,201 +783,78 @@ class Select(Statement, Generic[T]):
                     parts.append(where_after_match)
 
         # REMOVE clause (must come after WHERE, before RETURN)
-        if self._remove_clauses:
+        if remove_clauses:
             remove_parts: list[str] = []
-            for expr in self._remove_clauses:
+            for expr in remove_clauses:
                 if hasattr(expr, "to_cypher"):
                     remove_parts.append(expr.to_cypher(alias_map=alias_map))
                 else:
                     remove_parts.append(str(expr))
-            parts.append("REMOVE " + ", ".join(remove_parts))
-
-        # RETURN clause (required in Cypher)
-        if not self._returns_explicitly_set and not self._return_clauses:
-            # Auto-generate RETURN from match patterns or entities
-            if self._match_clauses:
-                # Extract entities from match patterns
-                auto_return = []
-                for match_item in self._match_clauses:
-                    if isinstance(match_item, tuple) and match_item[0] == "OPTIONAL":
-                        match_item = match_item[1]
-
-                    if isinstance(match_item, tuple) and len(match_item) == 3:
-                        # Relationship pattern: extract src and dst (skip edge)
-                        src, edge, dst = match_item
-                        auto_return.append(src)
-                        auto_return.append(dst)
-                    elif isinstance(match_item, type) or isinstance(match_item, str):
-                        # Single node or string pattern
-                        if isinstance(match_item, type):
-                            auto_return.append(match_item)
-                self._return_clauses = auto_return if auto_return else self._entities
-            else:
-                # Fallback to entities
-                self._return_clauses = self._entities
-
-        # Always include RETURN clause (required in Cypher)
-        if not self._return_clauses:
-            # If still empty, return all matched entities
-            all_entities = []
-            for match_item in self._match_clauses:
-                if isinstance(match_item, tuple) and match_item[0] == "OPTIONAL":
-                    match_item = match_item[1]
-
-                if isinstance(match_item, tuple) and len(match_item) == 3:
-                    src, edge, dst = match_item
-                    if isinstance(src, type):
-                        all_entities.append(src)
-                    if isinstance(dst, type):
-                        all_entities.append(dst)
-                elif isinstance(match_item, type):
-                    all_entities.append(match_item)
-
-            if all_entities:
-                self._return_clauses = all_entities
-            else:
-                # Last resort: return a wildcard
-                self._return_clauses = ["*"]
+            parts += (_REMOVE, ", ".join(remove_parts))
+
+        # RETURN clause (required in Cypher): derive from match patterns,
+        # then entities, and fall back to a wildcard as a last resort. The
+        # derived list stays local so later match() calls are picked up
+        if not return_clauses:
+            return_clauses = self._derive_auto_return(match_items) or entities or ["*"]
+
+        # RETURN and ORDER BY share one alias map that also covers edges; use
+        # alias_map from flow when WITH or match-after-with was used
+        if not (with_called or match_clauses_after_with):
+            alias_map = full_alias_map
 
-        if self._return_clauses:
+        if return_clauses:
             return_parts: list[str] = []
-            # Use alias_map from flow when WITH or match-after-with was used
-            if not (self._with_called or self._match_clauses_after_with):
-                alias_map = self._build_alias_map_from_match_clauses(
-                    include_edges=True
-                )
-                if not alias_map:
-                    for entity in self._entities:
-                        self._add_to_alias_map(entity, alias_map)
-            for expr in self._return_clauses:
-                if isinstance(expr, str):
-                    # String expression (e.g., "*" or raw Cypher)
-                    return_parts.append(expr)
-                elif hasattr(expr, "to_cypher"):
-                    # Pass alias_map to functions
-                    if hasattr(expr, "name"):  # It's a Function
-                        # If Function has label and was in WITH, use only the label in RETURN
-                        if (
-                            hasattr(expr, "_label")
-                            and expr._label
-                            and self._with_called
-                        ):
-                            # After WITH, use only the alias
-                            return_parts.append(expr._label)
-                        else:
-                            return_parts.append(expr.to_cypher(alias_map=alias_map))
-                    elif hasattr(expr, "left"):  # It's an ArithmeticExpression
-                        # If ArithmeticExpression has label and was in WITH, use only the label in RETURN
-                        if (
-                            hasattr(expr, "_label")
-                            and expr._label
-                            and self._with_called
-                        ):
-                            # After WITH, use only the alias
-                            return_parts.append(expr._label)
-                        else:
-                            # ArithmeticExpression doesn't take params
-                            return_parts.append(expr.to_cypher(alias_map=alias_map))
-                    else:
-                        # CaseExpression and other expressions need params
-                        return_parts.append(
-                            expr.to_cypher(params=self._params, alias_map=alias_map)
-                        )
-                elif isinstance(expr, type):
-                    # Node class or aliased class - get alias
-                    if hasattr(expr, "_alias"):
-                        # Aliased class
-                        return_parts.append(expr._alias)
-                    else:
-                        # Regular Node class - get default alias
-                        alias = self._get_alias_for_entity(expr)
-                        return_parts.append(alias)
-                elif hasattr(expr, "_alias"):
-                    # Aliased node class instance
-                    return_parts.append(expr._alias)
-                else:
-                    return_parts.append(str(expr))
+            for expr in return_clauses:
+                formatter = _RETURN_FORMATTERS.get(type(expr))
+                if formatter is None:
+                    formatter = _classify_return_expression(expr)
+                    _RETURN_FORMATTERS[type(expr)] = formatter
+                return_parts.append(formatter(self, expr, alias_map))
 
-            distinct_str = "DISTINCT " if self._distinct else ""
-            parts.append(f"RETURN {distinct_str}" + ", ".join(return_parts))
+            parts += (self._return_keyword, ", ".join(return_parts))
 
         # ORDER BY clause (must come after RETURN)
-        if self._order_by_clauses:
+        if order_by_clauses:
             order_parts: list[str] = []
-            # Use alias_map from flow when WITH or match-after-with was used
-            if not (self._with_called or self._match_clauses_after_with):
-                alias_map = self._build_alias_map_from_match_clauses(
-                    include_edges=True
-                )
-                if not alias_map:
-                    for entity in self._entities:
-                        self._add_to_alias_map(entity, alias_map)
-            for expr in self._order_by_clauses:
-                if hasattr(expr, "to_cypher"):
+            for to_cypher, expr in order_by_clauses:
+                if to_cypher is not None:
                     # Pass alias_map to OrderByExpression
-                    order_parts.append(expr.to_cypher(alias_map=alias_map))
+                    order_parts.append(to_cypher(alias_map=alias_map))
                 else:
                     order_parts.append(str(expr))
-            parts.append("ORDER BY " + ", ".join(order_parts))
+            parts += (_ORDER_BY, ", ".join(order_parts))
 
         # SKIP (must come before LIMIT in Cypher)
-        if self._skip_value is not None:
-            parts.append(f"SKIP {self._skip_value}")
+        if self._skip_fragment is not None:
+            parts.append(self._skip_fragment)
 
         # LIMIT
-        if self._limit_value is not None:
-            parts.append(f"LIMIT {self._limit_value}")
+        if self._limit_fragment is not None:
+            parts.append(self._limit_fragment)
 
-        return " ".join(parts)
+        self._cypher = " ".join(parts)
+        return self._cypher
 
-    def _entity_to_match_pattern(self, entity: Any) -> str:
+    def _derive_auto_return(self, match_items: list[Any]) -> list[Any]:
         """
-        Convert entity (Node class, alias, tuple pattern, etc.) to MATCH pattern.
+        Derive RETURN expressions from match patterns.
 
-        Supports:
-        - Node class: Page.alias("a") → (a:Page)
-        - Tuple pattern: (Page.alias("a"), Linked.alias("r"), Page.alias("b")) → (a:Page)-[r:Linked]->(b:Page)
-        - String pattern: "(a:Page)-[r:Linked]->(b:Page)" → as-is
+        Relationship patterns contribute their source and destination (the edge
+        is skipped), single Node classes contribute themselves.
 
-        :param entity: Node class, alias, tuple pattern, or string
-        :return: MATCH pattern string or None
+        :param match_items: Match clauses with OPTIONAL unwrapped and RAW dropped
+        :return: List of entities to return (empty if nothing can be derived)
         """
-        # Handle tuple patterns (relationship patterns)
-        if isinstance(entity, tuple) and len(entity) == 3:
-            src, edge, dst = entity
-            src_pattern = self._entity_to_match_pattern(src)
-            edge_pattern = self._edge_to_match_pattern(edge)
-            dst_pattern = self._entity_to_match_pattern(dst)
-
-            if src_pattern and edge_pattern and dst_pattern:
-                # Combine patterns: (src)-[edge]->(dst)
-                # src_pattern and dst_pattern already have parentheses
-                # Add direction -> for edges (outgoing relationship)
-                return f"{src_pattern}-{edge_pattern}->{dst_pattern}"
-            return None
-
-        # Handle Node classes and aliases
-        if isinstance(entity, type):
-            # Check if it's an aliased class first (has _alias attribute)
-            if hasattr(entity, "_alias"):
-                alias = entity._alias
-                # Get the actual node class from the aliased class
-                if hasattr(entity, "__bases__") and len(entity.__bases__) > 0:
-                    base_class = entity.__bases__[0]
-                    label = self._get_label_from_class(base_class)
-                else:
-                    label = entity.__name__
-                return f"({alias}:{label})"
-            # Regular Node class
-            elif hasattr(entity, "__labels__"):
-                alias = self._get_alias_for_entity(entity)
-                label = self._get_label_from_class(entity)
-                return f"({alias}:{label})"
-        elif isinstance(entity, str):
-            # String pattern (for complex patterns)
-            return entity
-
-        return None
+        auto_return: list[Any] = []
+        for match_item in match_items:
+            if isinstance(match_item, tuple) and len(match_item) == 3:
+                src, edge, dst = match_item
+                auto_return.append(src)
+                auto_return.append(dst)
+            elif isinstance(match_item, type):
+                auto_return.append(match_item)
+        return auto_return
 
 
 def select(*entities: Any) -> Select[Any]:
@@ -780,21 +877,4 @@ def aliased(node_class: type["Node"], name: str = None) -> type:
     """
     if name is None:
         name = node_class.__name__.lower()
-
-    # Create subclass with alias as class attribute
-    class AliasedNode(node_class):
-        _alias = name
-
-    # Set alias as class attribute (in case it wasn't set in class definition)
-    if not hasattr(AliasedNode, "_alias"):
-        AliasedNode._alias = name
-
-    # Copy class attributes
-    AliasedNode.__name__ = f"Aliased{node_class.__name__}"
-    AliasedNode.__qualname__ = f"Aliased{node_class.__qualname__}"
-
-    # Ensure __labels__ is copied from parent
-    if hasattr(node_class, "__labels__"):
-        AliasedNode.__labels__ = node_class.__labels__
-
-    return AliasedNode
+    return node_class._alias_classmethod(name)
@@ -1,7 +1,13 @@
-from enum import Enum
+# Graph command names as plain str constants: they are passed straight to
+# redis on every query, so there is no Enum member or .value indirection
+QUERY = "GRAPH.QUERY"
+RO_QUERY = "GRAPH.RO_QUERY"
+DELETE = "GRAPH.DELETE"
 
 
-class CMD(str, Enum):
-    QUERY = "GRAPH.QUERY"
-    RO_QUERY = "GRAPH.RO_QUERY"
-    DELETE = "GRAPH.DELETE"
+class CMD:
+    """Namespace kept for ``CMD.QUERY``-style access to the command names."""
+
+    QUERY = QUERY
+    RO_QUERY = RO_QUERY
+    DELETE = DELETE
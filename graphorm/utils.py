@@ -1,26 +1,32 @@
 import random
 import string
-from typing import List
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any
 
 
 def random_string(length: int = 10) -> str:
-    return "".join(
-        random.choice(string.ascii_lowercase) for _ in range(length)
-    )  # nosec
+    # random.choices draws all characters in one C-level call
+    return "".join(random.choices(string.ascii_lowercase, k=length))  # nosec
 
 
 def quote_string(v):
-    if isinstance(v, bytes):
-        v = v.decode()
-    elif not isinstance(v, str):
-        return v
-    if len(v) == 0:
+    # Plain str is by far the common input; test it before the isinstance checks
+    if type(v) is not str:
+        if isinstance(v, bytes):
+            v = v.decode()
+        elif not isinstance(v, str):
+            return v
+    if not v:
         return '""'
 
-    v = v.replace("\\", "\\\\")
-    v = v.replace('"', '\\"')
+    # Most values contain nothing to escape; only replace what is present
+    if "\\" in v:
+        v = v.replace("\\", "\\\\")
+    if '"' in v:
+        v = v.replace('"', '\\"')
 
-    return '"{}"'.format(v)
+    return '"' + v + '"'
 
 
 def format_cypher_value(value):
@@ -31,36 +37,47 @@ def format_cypher_value(value):
     :param value: Value to format
     :return: Formatted string for Cypher
     """
-    if isinstance(value, bool):
-        return "true" if value else "false"
-    elif isinstance(value, str):
-        return quote_string(value)
-    elif value is None:
-        return "null"
-    elif isinstance(value, (list, tuple)):
-        return f'[{",".join(map(format_cypher_value, value))}]'
-    elif isinstance(value, dict):
-        return (
-            f'{{{",".join(f"{k}:{format_cypher_value(v)}" for k, v in value.items())}}}'
-        )
-    else:
-        return str(value)
+    formatter = _CYPHER_VALUE_FORMATTERS.get(type(value))
+    if formatter is None:
+        formatter = _formatter_for_subclass(_CYPHER_VALUE_FORMATTERS, type(value))
+    return formatter(value)
 
 
-def get_pk_fields(obj) -> List[str]:
+def get_pk_fields(obj) -> list[str]:
     """
     Return primary key field names as a list from obj.__primary_key__.
     :param obj: Node or similar with __primary_key__ (str or list)
     :return: list of field names
     """
+    return list(_pk_fields(obj))
+
+
+def _pk_fields(obj) -> tuple[str, ...]:
+    """
+    Return primary key field names as a tuple, cached on the class when
+    __primary_key__ is declared there.
+
+    :param obj: Node or similar with __primary_key__ (str or list)
+    :return: tuple of field names
+    """
+    cls = obj if isinstance(obj, type) else type(obj)
+    fields = cls.__dict__.get("__primary_key_fields__")
+    if fields is not None:
+        return fields
     pk = getattr(obj, "__primary_key__", None)
     if pk is None:
-        return []
+        return ()
     if isinstance(pk, str):
-        return [pk]
-    if isinstance(pk, list):
-        return list(pk)
-    return []
+        fields = (pk,)
+    elif isinstance(pk, list):
+        fields = tuple(pk)
+    else:
+        return ()
+    # Only share the result when the key is declared on the class itself
+    if pk is getattr(cls, "__primary_key__", None):
+        with suppress(AttributeError, TypeError):
+            cls.__primary_key_fields__ = fields
+    return fields
 
 
 def format_pk_cypher_map(obj) -> str:
@@ -70,31 +87,112 @@ def format_pk_cypher_map(obj) -> str:
     :param obj: Node or similar with __primary_key__ and .properties
     :return: Cypher map string or empty string if no pk
     """
-    fields = get_pk_fields(obj)
+    fields = _pk_fields(obj)
     if not fields:
         return ""
     props = getattr(obj, "properties", None)
     if props is None:
         return ""
-    parts = []
-    for k in fields:
-        v = (
-            props.get(k)
-            if hasattr(props, "get")
-            else (props[k] if k in props else None)
+    # Pick the lookup once per call rather than probing props for every field
+    if hasattr(props, "get"):
+        values = [props.get(k) for k in fields]
+    else:
+        values = [props[k] if k in props else None for k in fields]
+    return (
+        "{"
+        + ", ".join(
+            [
+                f"{k}:{format_cypher_value(v)}"
+                for k, v in zip(fields, values, strict=True)
+            ]
         )
-        parts.append(f"{k}:{format_cypher_value(v)}")
-    return "{" + ", ".join(parts) + "}"
+        + "}"
+    )
 
 
 def stringify_param_value(value):
-    if isinstance(value, str):
-        return quote_string(value)
-    elif value is None:
-        return "null"
-    elif isinstance(value, (list, tuple)):
-        return f'[{",".join(map(stringify_param_value, value))}]'
-    elif isinstance(value, dict):
-        return f'{{{",".join(f"{k}:{stringify_param_value(v)}" for k, v in value.items())}}}'
-    else:
-        return str(value)
+    formatter = _PARAM_VALUE_FORMATTERS.get(type(value))
+    if formatter is None:
+        formatter = _formatter_for_subclass(_PARAM_VALUE_FORMATTERS, type(value))
+    return formatter(value)
+
+
+def _formatter_for_subclass(
+    formatters: dict[type, Callable[[Any], str]], value_type: type
+) -> Callable[[Any], str]:
+    """
+    Find the formatter registered for the nearest base class of value_type.
+
+    :param formatters: Formatter table keyed by exact type
+    :param value_type: Type with no entry of its own (e.g. a str subclass)
+    :return: Formatter of the closest registered base, str() if none
+    """
+    for base in value_type.__mro__:
+        formatter = formatters.get(base)
+        if formatter is not None:
+            return formatter
+    return str
+
+
+def _format_null(value: None) -> str:
+    return "null"
+
+
+def _format_cypher_sequence(value: list | tuple) -> str:
+    if not value:
+        return "[]"
+    return "[" + ",".join([format_cypher_value(v) for v in value]) + "]"
+
+
+def _format_cypher_map(value: dict) -> str:
+    if not value:
+        return "{}"
+    return (
+        "{"
+        + ",".join([f"{k}:{format_cypher_value(v)}" for k, v in value.items()])
+        + "}"
+    )
+
+
+def _format_param_sequence(value: list | tuple) -> str:
+    if not value:
+        return "[]"
+    return "[" + ",".join([stringify_param_value(v) for v in value]) + "]"
+
+
+def _format_param_map(value: dict) -> str:
+    if not value:
+        return "{}"
+    return (
+        "{"
+        + ",".join([f"{k}:{stringify_param_value(v)}" for k, v in value.items()])
+        + "}"
+    )
+
+
+# Cypher boolean literals, looked up instead of branching on the value
+_BOOL_STR = {True: "true", False: "false"}
+
+# Formatter per exact value type; subclasses use their nearest registered base
+_CYPHER_VALUE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bool: _BOOL_STR.__getitem__,
+    str: quote_string,
+    type(None): _format_null,
+    int: str,
+    float: str,
+    list: _format_cypher_sequence,
+    tuple: _format_cypher_sequence,
+    dict: _format_cypher_map,
+}
+
+# Parameter values keep Python's str() for bool/int/float
+_PARAM_VALUE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: quote_string,
+    type(None): _format_null,
+    bool: str,
+    int: str,
+    float: str,
+    list: _format_param_sequence,
+    tuple: _format_param_sequence,
+    dict: _format_param_map,
+}
@@ -15,7 +15,7 @@ class VariableLength:
     Use via Edge.variable_length(min_hops, max_hops) or VariableLength(EdgeClass, min_hops, max_hops).
     """
 
-    __slots__ = ("edge_class", "min_hops", "max_hops")
+    __slots__ = ("edge_class", "_min_hops", "_max_hops", "_suffix")
 
     def __init__(
         self,
@@ -30,11 +30,37 @@ class VariableLength:
         """
         if min_hops is not None and min_hops < 0:
             raise ValueError("min_hops must be >= 0")
-        if max_hops is not None and max_hops < 0:
-            raise ValueError("max_hops must be >= 0")
-        if min_hops is not None and max_hops is not None and min_hops > max_hops:
-            raise ValueError("min_hops must be <= max_hops")
+        if max_hops is not None:
+            if max_hops < 0:
+                raise ValueError("max_hops must be >= 0")
+            if min_hops is not None and min_hops > max_hops:
+                raise ValueError("min_hops must be <= max_hops")
 
         self.edge_class: type = edge_class
-        self.min_hops: int | None = min_hops
-        self.max_hops: int | None = max_hops
+        self._min_hops: int | None = min_hops
+        self._max_hops: int | None = max_hops
+
+        # Hop-range suffix of the edge pattern, rendered once per descriptor
+        if min_hops is None:
+            self._suffix: str = "*"
+        elif min_hops == max_hops:
+            self._suffix = f"*{min_hops}"
+        elif max_hops is not None:
+            self._suffix = f"*{min_hops}..{max_hops}"
+        else:
+            self._suffix = f"*{min_hops}.."
+
+    @property
+    def min_hops(self) -> int | None:
+        """Minimum number of hops (None = unbounded lower)."""
+        return self._min_hops
+
+    @property
+    def max_hops(self) -> int | None:
+        """Maximum number of hops (None = unbounded upper)."""
+        return self._max_hops
+
+    @property
+    def suffix(self) -> str:
+        """Hop-range suffix of the edge pattern, e.g. "*1..3"."""
+        return self._suffix
@@ -1,10 +1,14 @@
+import logging
 import os
 import time
+import uuid
 
 import pytest
 import redis
 from testcontainers.core.container import DockerContainer
 
+from graphorm.graph import Graph
+
 
 @pytest.fixture(scope="session")
 def falkordb_container():
@@ -17,15 +21,19 @@ def falkordb_container():
     port = container.get_exposed_port(6379)
 
     # Wait for server to be ready
+    # Poll with exponential backoff: the server is usually up well under a second
     r = redis.Redis(host=host, port=int(port), decode_responses=False)
-    for _ in range(30):
+    deadline = time.monotonic() + 30
+    delay = 0.05
+    while True:
         try:
             r.ping()
             break
         except (redis.exceptions.ConnectionError, redis.exceptions.BusyLoadingError):
-            time.sleep(1)
-    else:
-        pytest.fail("Could not start FalkorDB container")
+            if time.monotonic() >= deadline:
+                pytest.fail("Could not start FalkorDB container")
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
 
     yield {
         "host": host,
@@ -35,10 +43,19 @@ def falkordb_container():
     container.stop()
 
 
+@pytest.fixture(scope="session")
+def redis_connection(falkordb_container):
+    """Redis client whose connection pool is shared by every test graph."""
+    connection = redis.Redis(
+        host=falkordb_container["host"],
+        port=falkordb_container["port"],
+    )
+    yield connection
+    connection.close()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def configure_logging():
-    import logging
-
     logging.getLogger("pika").setLevel(logging.WARNING)
 
 
@@ -56,33 +73,17 @@ def set_test_environments(falkordb_container, session_mocker):
 
 
 @pytest.fixture(scope="function")
-def graph(falkordb_container):
+def graph(redis_connection):
     """Create a Graph instance for testing."""
-    import uuid
-
-    from graphorm.graph import Graph
-
-    G = Graph(
-        str(uuid.uuid4()),
-        host=falkordb_container["host"],
-        port=falkordb_container["port"],
-    )
+    G = Graph(str(uuid.uuid4()), connection=redis_connection)
     G.create()
     yield G
     G.delete()
 
 
 @pytest.fixture(scope="function")
-def empty_graph(falkordb_container):
+def empty_graph(redis_connection):
     """Create a Graph instance without calling create() (for idempotency tests)."""
-    import uuid
-
-    from graphorm.graph import Graph
-
-    G = Graph(
-        str(uuid.uuid4()),
-        host=falkordb_container["host"],
-        port=falkordb_container["port"],
-    )
+    G = Graph(str(uuid.uuid4()), connection=redis_connection)
     yield G
     G.delete()
@@ -20,4 +20,4 @@ def test_fill_random_graph(graph):
             for l in range(1, 11):
                 graph.add_node(l_node := TestNode(code=f"l_{i}_{j}_{l}"))
                 graph.add_edge(TestEdge(j_node, l_node))
-                graph.flush()
+    graph.flush()
@@ -367,3 +367,91 @@ def test_to_cypher_generation(graph):
     skip_pos = cypher.find("SKIP")
     limit_pos = cypher.find("LIMIT")
     assert skip_pos < limit_pos
+
+
+def test_to_cypher_is_cached_until_next_builder_call():
+    """Repeated to_cypher() reuses the compiled query and its parameters."""
+
+    class Page(Node):
+        __primary_key__ = ["path"]
+        path: str
+        parsed: bool
+
+    stmt = select().match(Page).where(Page.path == "/home")
+    cypher = stmt.to_cypher()
+    params = stmt.get_params()
+
+    assert stmt.to_cypher() is cypher
+    assert stmt.get_params() == params == {"param_0": "/home"}
+
+    # Any builder call invalidates the cached query
+    stmt.limit(10)
+    cypher = stmt.to_cypher()
+    assert cypher.endswith("LIMIT 10")
+    assert "$param_0" in cypher
+    assert stmt.get_params() == {"param_0": "/home"}
+
+
+def test_resolved_alias_is_not_inherited_by_aliased_class():
+    """Alias/pattern resolved for a Node class must not leak into its aliases."""
+
+    class Page(Node):
+        __primary_key__ = ["path"]
+        path: str
+
+    assert select(Page).to_cypher() == "MATCH (page:Page) RETURN page"
+    assert select().match(Page.alias("p")).to_cypher() == "MATCH (p:Page) RETURN p"
+    assert select().match(aliased(Page, "q")).to_cypher() == "MATCH (q:Page) RETURN q"
+
+
+def test_alias_returns_same_class_for_same_name():
+    """Aliasing a class twice under one name reuses the aliased class."""
+
+    class Page(Node):
+        __primary_key__ = ["path"]
+        path: str
+
+    assert Page.alias("p") is Page.alias("p")
+    assert aliased(Page, "p") is Page.alias("p")
+    assert Page.alias("p") is not Page.alias("q")
+    assert select().match(Page.alias("p")).to_cypher() == "MATCH (p:Page) RETURN p"
+
+
+def test_alias_keeps_real_class_in_registry():
+    """Aliasing a class does not replace it in the label registry."""
+    from graphorm.registry import Registry
+
+    class Page(Node):
+        __label__ = "AliasRegistryPage"
+        __primary_key__ = ["path"]
+        path: str
+
+    Page.alias("p")
+    assert Registry.get_node("AliasRegistryPage") is Page
+
+
+def test_auto_return_follows_later_match_calls():
+    """Auto-derived RETURN is not frozen by an earlier to_cypher() call."""
+
+    class Page(Node):
+        __primary_key__ = ["path"]
+        path: str
+
+    a = Page.alias("a")
+    b = Page.alias("b")
+    stmt = select().match(a)
+    assert stmt.to_cypher() == "MATCH (a:Page) RETURN a"
+
+    stmt.match(b)
+    assert stmt.to_cypher() == "MATCH (a:Page), (b:Page) RETURN a, b"
+
+
+def test_returns_distinct_without_expressions_on_single_node():
+    """returns_distinct() with no arguments keeps DISTINCT for a lone Node match."""
+
+    class Page(Node):
+        __primary_key__ = ["path"]
+        path: str
+
+    stmt = select().match(Page).returns_distinct()
+    assert stmt.to_cypher() == "MATCH (page:Page) RETURN DISTINCT page"
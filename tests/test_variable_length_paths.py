@@ -2,6 +2,8 @@
 Tests for variable-length paths in MATCH patterns.
 """
 
+import pytest
+
 from graphorm import (
     Edge,
     Node,
@@ -213,3 +215,15 @@ def test_variable_length_path_orm_with_where_and_returns():
     assert "*1..3" in cypher
     assert "WHERE" in cypher
     assert "RETURN" in cypher
+
+
+def test_variable_length_hop_bounds_are_read_only():
+    """Hop bounds cannot change after the suffix is rendered."""
+
+    class Linked(Edge):
+        pass
+
+    v = Linked.variable_length(1, 3)
+    with pytest.raises(AttributeError):
+        v.max_hops = 5
+    assert (v.min_hops, v.max_hops, v.suffix) == (1, 3, "*1..3")